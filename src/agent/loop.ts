@@ -74,6 +74,11 @@ interface MainTraceContext {
 
 type SessionImVerboseMode = "default" | "on" | "off";
 
+type SlashCommandHandler = (
+  message: InboundMessage,
+  session: Session,
+) => Promise<OutboundMessage>;
+
 function isObject(value: unknown): value is Record<string, unknown> {
   return typeof value === "object" && value !== null && !Array.isArray(value);
 }
@@ -167,6 +172,20 @@ export class AgentLoop {
   private readonly memuAgentId: string;
   private readonly memuScopes: { chat: string; papers: string };
   private readonly memoryConfig: MemoryConfig;
+  private readonly slashCommands = new Map<string, SlashCommandHandler>([
+    ["/new", (message, session) => this.handleNewSessionCommand(message, session)],
+    ["/help", async (message) => this.commandReply(message, AgentLoop.helpMessage())],
+    [
+      "/verbose",
+      async (message, session) =>
+        this.commandReply(
+          message,
+          `${this.describeSessionImVerboseMode(session)}\n用法：/verbose on 或 /verbose off`,
+        ),
+    ],
+    ["/verbose on", (message, session) => this.handleVerboseCommand(message, session, "on")],
+    ["/verbose off", (message, session) => this.handleVerboseCommand(message, session, "off")],
+  ]);
   private readonly workflowTraceCursor = new Map<
     string,
     {
@@ -826,6 +845,63 @@ export class AgentLoop {
     ].join("\n");
   }
 
+  private commandReply(message: InboundMessage, content: string): OutboundMessage {
+    return {
+      channel: message.channel,
+      chatId: message.chatId,
+      content,
+    };
+  }
+
+  private async handleNewSessionCommand(
+    message: InboundMessage,
+    session: Session,
+  ): Promise<OutboundMessage> {
+    const lock = this.getConsolidationLock(session.key);
+    this.consolidating.add(session.key);
+    try {
+      await lock.runExclusive(async () => {
+        const snapshot = session.messages.slice(session.lastConsolidated);
+        if (snapshot.length === 0) {
+          return;
+        }
+        const temp = new Session(session.key);
+        temp.messages = [...snapshot];
+        const ok = await this.localConsolidator(session.key).consolidate({
+          session: temp,
+          provider: this.provider,
+          model: this.model,
+          archiveAll: true,
+          memoryWindow: this.memoryWindow,
+        });
+        if (!ok) {
+          throw new Error("consolidate_failed");
+        }
+      });
+    } catch {
+      this.consolidating.delete(session.key);
+      return this.commandReply(
+        message,
+        "Memory archival failed, session not cleared. Please try again.",
+      );
+    }
+    this.consolidating.delete(session.key);
+    session.clear();
+    await this.sessions.save(session);
+    this.sessions.invalidate(session.key);
+    return this.commandReply(message, "New session started.");
+  }
+
+  private async handleVerboseCommand(
+    message: InboundMessage,
+    session: Session,
+    mode: "on" | "off",
+  ): Promise<OutboundMessage> {
+    this.setSessionImVerboseMode(session, mode);
+    await this.sessions.save(session);
+    return this.commandReply(message, this.describeSessionImVerboseMode(session));
+  }
+
   private getSessionImVerboseMode(session: Session): SessionImVerboseMode {
     const raw = session.metadata.im_verbose;
     return raw === "on" || raw === "off" ? raw : "default";
@@ -1196,68 +1272,9 @@ export class AgentLoop {
     const session = await this.sessions.getOrCreate(key);
     const command = message.content.trim().toLowerCase();
 
-    if (command === "/new") {
-      const lock = this.getConsolidationLock(session.key);
-      this.consolidating.add(session.key);
-      try {
-        await lock.runExclusive(async () => {
-          const snapshot = session.messages.slice(session.lastConsolidated);
-          if (snapshot.length === 0) {
-            return;
-          }
-          const temp = new Session(session.key);
-          temp.messages = [...snapshot];
-          const ok = await this.localConsolidator(session.key).consolidate({
-            session: temp,
-            provider: this.provider,
-            model: this.model,
-            archiveAll: true,
-            memoryWindow: this.memoryWindow,
-          });
-          if (!ok) {
-            throw new Error("consolidate_failed");
-          }
-        });
-      } catch {
-        this.consolidating.delete(session.key);
-        return {
-          channel: message.channel,
-          chatId: message.chatId,
-          content: "Memory archival failed, session not cleared. Please try again.",
-        };
-      }
-      this.consolidating.delete(session.key);
-      session.clear();
-      await this.sessions.save(session);
-      this.sessions.invalidate(session.key);
-      return {
-        channel: message.channel,
-        chatId: message.chatId,
-        content: "New session started.",
-      };
-    }
-    if (command === "/help") {
-      return {
-        channel: message.channel,
-        chatId: message.chatId,
-        content: AgentLoop.helpMessage(),
-      };
-    }
-    if (command === "/verbose") {
-      return {
-        channel: message.channel,
-        chatId: message.chatId,
-        content: `${this.describeSessionImVerboseMode(session)}\n用法：/verbose on 或 /verbose off`,
-      };
-    }
-    if (command === "/verbose on" || command === "/verbose off") {
-      this.setSessionImVerboseMode(session, command.endsWith("on") ? "on" : "off");
-      await this.sessions.save(session);
-      return {
-        channel: message.channel,
-        chatId: message.chatId,
-        content: this.describeSessionImVerboseMode(session),
-      };
+    const slashCommand = this.slashCommands.get(command);
+    if (slashCommand) {
+      return slashCommand(message, session);
     }
 
     const unconsolidated = session.messages.length - session.lastConsolidated;
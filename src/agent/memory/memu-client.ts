@@ -401,23 +401,21 @@ export class MemUClient {
     const categoryLines: string[] = [];
     for (const category of result.categories.slice(0, maxCategories)) {
       const name = firstString(category, ["name", "title"], "category");
-      const summary = firstString(category, ["summary", "description"], compactJson(category));
+      const summary = firstString(category, ["summary", "description"]) ?? compactJson(category);
       categoryLines.push(`- ${name}: ${summary}`);
     }
 
     const itemLines: string[] = [];
     for (const item of result.items.slice(0, maxItems)) {
-      const summary = firstString(
-        item,
-        ["summary", "memory_content", "content", "text", "title"],
-        compactJson(item),
-      );
+      const summary =
+        firstString(item, ["summary", "memory_content", "content", "text", "title"]) ??
+        compactJson(item);
       itemLines.push(`- ${summary}`);
     }
 
     const resourceLines: string[] = [];
     for (const resource of result.resources.slice(0, maxResources)) {
-      const url = firstString(resource, ["resource_url", "url", "path"], compactJson(resource));
+      const url = firstString(resource, ["resource_url", "url", "path"]) ?? compactJson(resource);
       resourceLines.push(`- ${url}`);
     }
 
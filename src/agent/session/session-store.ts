@@ -113,20 +113,18 @@ export class SessionStore {
   private async load(key: string): Promise<Session | null> {
     try {
       const raw = await readFile(this.sessionPath(key), "utf8");
-      const lines = raw
-        .split("\n")
-        .map((line) => line.trim())
-        .filter(Boolean);
-      if (lines.length === 0) {
-        return null;
-      }
-
       let createdAt: Date | undefined;
       let lastConsolidated = 0;
       let metadata: Record<string, unknown> = {};
       const messages: SessionMessage[] = [];
+      let hasLines = false;
 
-      for (const line of lines) {
+      for (const rawLine of raw.split("\n")) {
+        const line = rawLine.trim();
+        if (!line) {
+          continue;
+        }
+        hasLines = true;
         const data = JSON.parse(line) as Record<string, unknown>;
         if (data._type === "metadata") {
           createdAt = typeof data.created_at === "string" ? new Date(data.created_at) : undefined;
@@ -140,6 +138,9 @@ export class SessionStore {
         }
         messages.push(data as SessionMessage);
       }
+      if (!hasLines) {
+        return null;
+      }
 
       return new Session(key, {
         messages,
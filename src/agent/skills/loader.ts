@@ -160,6 +160,7 @@ export class SkillsLoader {
 
   async listSkills(filterUnavailable = true): Promise<SkillInfo[]> {
     const out: SkillInfo[] = [];
+    const workspaceNames = new Set<string>();
 
     if (await existsDir(this.workspaceSkills)) {
       const entries = await readdir(this.workspaceSkills);
@@ -167,6 +168,7 @@ export class SkillsLoader {
         const skillFile = await findSkillFile(this.workspaceSkills, name);
         if (skillFile) {
           out.push({ name, path: skillFile, source: "workspace" });
+          workspaceNames.add(name);
         }
       }
     }
@@ -174,7 +176,7 @@ export class SkillsLoader {
     if (await existsDir(this.builtinSkills)) {
       const entries = await readdir(this.builtinSkills);
       for (const name of entries) {
-        if (out.some((skill) => skill.name === name)) {
+        if (workspaceNames.has(name)) {
           continue;
         }
         const skillFile = await findSkillFile(this.builtinSkills, name);
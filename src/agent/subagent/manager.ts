@@ -1132,7 +1132,7 @@ Focus on these skills for this task: ${listedSkills}`);
           }
         }
 
-        for (const toolCall of response.toolCalls) {
+        for (const [index, toolCall] of response.toolCalls.entries()) {
           const toolSpanId = this.newTraceSpanId();
           if (this.traceEnabled()) {
             await this.emitSubagentTraceEvent({
@@ -1145,7 +1145,7 @@ Focus on these skills for this task: ${listedSkills}`);
               phase: "start",
               status: "running",
               iteration: iterationNumber,
-              content: `${toolCall.name}(${JSON.stringify(toolCall.arguments).slice(0, 180)})`,
+              content: `${toolCall.name}(${toolCallDicts[index].function.arguments.slice(0, 180)})`,
               originChannel: options.originChannel,
               originChatId: options.originChatId,
               metadata: {
@@ -1170,7 +1170,7 @@ Focus on these skills for this task: ${listedSkills}`);
               phase: "end",
               status: result.startsWith("Error:") ? "error" : "ok",
               iteration: iterationNumber,
-              content: `${toolCall.name} -> ${truncateLogContent(result).slice(0, 220)}`,
+              content: `${toolCall.name} -> ${resultText.slice(0, 220)}`,
               originChannel: options.originChannel,
               originChatId: options.originChatId,
               metadata: traceMessageMeta,
@@ -4,7 +4,7 @@ import { stderr, stdin, stdout } from "node:process";
 
 import type { InboundMessage, OutboundMessage } from "../bus/events.js";
 import { createAppRuntime } from "./runtime.js";
-import { createLogger } from "../utils/logger.js";
+import { createLogger, flushLogs } from "../utils/logger.js";
 
 type CliMode = "repl" | "gateway";
 
@@ -310,11 +310,15 @@ async function runGateway(): Promise<void> {
 
 async function main(): Promise<void> {
   const mode = parseCliMode(process.argv.slice(2));
-  if (mode === "gateway") {
-    await runGateway();
-    return;
+  try {
+    if (mode === "gateway") {
+      await runGateway();
+      return;
+    }
+    await runRepl();
+  } finally {
+    flushLogs();
   }
-  await runRepl();
 }
 
 export { main, parseCliMode };
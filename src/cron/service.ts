@@ -86,6 +86,36 @@ function parseNumberSet(
   return set;
 }
 
+const WEEKDAY_INDEX: Record<string, number> = {
+  Sun: 0,
+  Mon: 1,
+  Tue: 2,
+  Wed: 3,
+  Thu: 4,
+  Fri: 5,
+  Sat: 6,
+};
+
+const dateFormatters = new Map<string, Intl.DateTimeFormat>();
+
+function getDateFormatter(tz: string): Intl.DateTimeFormat {
+  let formatter = dateFormatters.get(tz);
+  if (!formatter) {
+    formatter = new Intl.DateTimeFormat("en-US", {
+      timeZone: tz,
+      hourCycle: "h23",
+      year: "numeric",
+      month: "numeric",
+      day: "numeric",
+      hour: "numeric",
+      minute: "numeric",
+      weekday: "short",
+    });
+    dateFormatters.set(tz, formatter);
+  }
+  return formatter;
+}
+
 function getDateParts(date: Date, tz?: string | null): {
   minute: number;
   hour: number;
@@ -103,38 +133,20 @@ function getDateParts(date: Date, tz?: string | null): {
     };
   }
 
-  const parts = new Intl.DateTimeFormat("en-US", {
-    timeZone: tz,
-    hourCycle: "h23",
-    year: "numeric",
-    month: "numeric",
-    day: "numeric",
-    hour: "numeric",
-    minute: "numeric",
-    weekday: "short",
-  }).formatToParts(date);
+  const parts = getDateFormatter(tz).formatToParts(date);
 
   const pickNumber = (type: string): number => {
     const part = parts.find((item) => item.type === type)?.value ?? "0";
     return Number.parseInt(part, 10);
   };
   const weekday = parts.find((item) => item.type === "weekday")?.value ?? "Sun";
-  const weekdayMap: Record<string, number> = {
-    Sun: 0,
-    Mon: 1,
-    Tue: 2,
-    Wed: 3,
-    Thu: 4,
-    Fri: 5,
-    Sat: 6,
-  };
 
   return {
     minute: pickNumber("minute"),
     hour: pickNumber("hour"),
     dayOfMonth: pickNumber("day"),
     month: pickNumber("month"),
-    dayOfWeek: weekdayMap[weekday] ?? 0,
+    dayOfWeek: WEEKDAY_INDEX[weekday] ?? 0,
   };
 }
 
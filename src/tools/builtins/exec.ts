@@ -71,8 +71,8 @@ export class ExecTool extends Tool {
         env: process.env,
       });
 
-      let stdout = "";
-      let stderr = "";
+      const stdoutChunks: Buffer[] = [];
+      const stderrChunks: Buffer[] = [];
       let done = false;
 
       const finish = (value: string) => {
@@ -98,11 +98,11 @@ export class ExecTool extends Tool {
         { once: true },
       );
 
-      child.stdout.on("data", (chunk) => {
-        stdout += String(chunk);
+      child.stdout.on("data", (chunk: Buffer) => {
+        stdoutChunks.push(chunk);
       });
-      child.stderr.on("data", (chunk) => {
-        stderr += String(chunk);
+      child.stderr.on("data", (chunk: Buffer) => {
+        stderrChunks.push(chunk);
       });
       child.on("error", (error) => {
         clearTimeout(timer);
@@ -110,6 +110,8 @@ export class ExecTool extends Tool {
       });
       child.on("close", (code) => {
         clearTimeout(timer);
+        const stdout = Buffer.concat(stdoutChunks).toString("utf8");
+        const stderr = Buffer.concat(stderrChunks).toString("utf8");
         const parts: string[] = [];
         if (stdout.trim()) {
           parts.push(stdout);
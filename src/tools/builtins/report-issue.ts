@@ -47,6 +47,23 @@ function parseLogTimestamp(line: string): number | null {
   return Number.isFinite(parsed) ? parsed : null;
 }
 
+function tailLogLines(raw: string, cutoff: number, maxLines: number): string[] {
+  const lines: string[] = [];
+  let end = raw.length;
+  while (end > 0 && lines.length < maxLines) {
+    const start = raw.lastIndexOf("\n", end - 1) + 1;
+    const line = raw.slice(start, end).trimEnd();
+    if (line) {
+      const ts = parseLogTimestamp(line);
+      if (ts === null || ts >= cutoff) {
+        lines.push(line);
+      }
+    }
+    end = start - 1;
+  }
+  return lines.reverse();
+}
+
 export class ReportIssueTool extends Tool {
   readonly name = "report_issue";
   readonly description =
@@ -199,16 +216,7 @@ export class ReportIssueTool extends Tool {
       if (!raw) {
         continue;
       }
-      const lines = raw
-        .split("\n")
-        .map((line) => line.trimEnd())
-        .filter(Boolean)
-        .filter((line) => {
-          const ts = parseLogTimestamp(line);
-          return ts === null || ts >= cutoff;
-        })
-        .slice(-maxLines)
-        .map((line) => redactText(line));
+      const lines = tailLogLines(raw, cutoff, maxLines).map((line) => redactText(line));
       if (lines.length > 0) {
         out.push({
           file: name,
@@ -4,13 +4,17 @@ const RETRY_HINT = "\n\n[Analyze the error above and try a different approach.]"
 
 export class ToolRegistry {
   private readonly tools = new Map<string, Tool>();
+  private definitions: Record<string, unknown>[] | null = null;
 
   register(tool: Tool): void {
     this.tools.set(tool.name, tool);
+    this.definitions = null;
   }
 
   unregister(name: string): void {
-    this.tools.delete(name);
+    if (this.tools.delete(name)) {
+      this.definitions = null;
+    }
   }
 
   get(name: string): Tool | undefined {
@@ -22,7 +26,10 @@ export class ToolRegistry {
   }
 
   getDefinitions(): Record<string, unknown>[] {
-    return Array.from(this.tools.values()).map((tool) => tool.toSchema());
+    if (!this.definitions) {
+      this.definitions = Array.from(this.tools.values()).map((tool) => tool.toSchema());
+    }
+    return this.definitions;
   }
 
   get names(): string[] {
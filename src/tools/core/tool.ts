@@ -25,59 +25,81 @@ function typeMatches(value: unknown, typeName: TypeName): boolean {
   }
 }
 
-function validateRecursive(value: unknown, schema: JsonSchema, path = "parameter"): string[] {
-  const errors: string[] = [];
-  const schemaType = schema.type as TypeName | undefined;
-  if (schemaType && !typeMatches(value, schemaType)) {
-    return [`${path} should be ${schemaType}`];
-  }
+type SchemaValidator = (value: unknown, path: string, errors: string[]) => void;
 
-  if (schema.enum && !schema.enum.includes(value as JsonValue)) {
-    errors.push(`${path} must be one of ${JSON.stringify(schema.enum)}`);
-  }
+const compiledSchemas = new WeakMap<JsonSchema, SchemaValidator>();
 
-  if (typeof value === "number") {
-    if (schema.minimum !== undefined && value < schema.minimum) {
-      errors.push(`${path} must be >= ${schema.minimum}`);
-    }
-    if (schema.maximum !== undefined && value > schema.maximum) {
-      errors.push(`${path} must be <= ${schema.maximum}`);
+function childPath(path: string, key: string): string {
+  return path === "parameter" ? key : `${path}.${key}`;
+}
+
+function isSchemaObject(value: unknown): value is JsonSchema {
+  return typeof value === "object" && value !== null && !Array.isArray(value);
+}
+
+function compileSchema(schema: JsonSchema): SchemaValidator {
+  const schemaType = schema.type as TypeName | undefined;
+  const { enum: enumValues, minimum, maximum, minLength, maxLength } = schema;
+  const required = schemaType === "object" ? (schema.required ?? []) : [];
+  const properties = new Map<string, SchemaValidator>();
+  if (schemaType === "object") {
+    for (const [key, propSchema] of Object.entries(schema.properties ?? {})) {
+      if (isSchemaObject(propSchema)) {
+        properties.set(key, compileSchema(propSchema));
+      }
     }
   }
+  const items =
+    schemaType === "array" && isSchemaObject(schema.items) ? compileSchema(schema.items) : null;
 
-  if (typeof value === "string") {
-    if (schema.minLength !== undefined && value.length < schema.minLength) {
-      errors.push(`${path} must be at least ${schema.minLength} chars`);
+  return (value, path, errors) => {
+    if (schemaType && !typeMatches(value, schemaType)) {
+      errors.push(`${path} should be ${schemaType}`);
+      return;
     }
-    if (schema.maxLength !== undefined && value.length > schema.maxLength) {
-      errors.push(`${path} must be at most ${schema.maxLength} chars`);
+
+    if (enumValues && !enumValues.includes(value as JsonValue)) {
+      errors.push(`${path} must be one of ${JSON.stringify(enumValues)}`);
     }
-  }
 
-  if (schemaType === "object") {
-    const obj = value as Record<string, unknown>;
-    const properties = schema.properties ?? {};
-    for (const key of schema.required ?? []) {
-      if (!(key in obj)) {
-        errors.push(`missing required ${path === "parameter" ? key : `${path}.${key}`}`);
+    if (typeof value === "number") {
+      if (minimum !== undefined && value < minimum) {
+        errors.push(`${path} must be >= ${minimum}`);
+      }
+      if (maximum !== undefined && value > maximum) {
+        errors.push(`${path} must be <= ${maximum}`);
       }
     }
-    for (const [key, propValue] of Object.entries(obj)) {
-      const propSchema = properties[key];
-      if (propSchema) {
-        const nextPath = path === "parameter" ? key : `${path}.${key}`;
-        errors.push(...validateRecursive(propValue, propSchema, nextPath));
+
+    if (typeof value === "string") {
+      if (minLength !== undefined && value.length < minLength) {
+        errors.push(`${path} must be at least ${minLength} chars`);
+      }
+      if (maxLength !== undefined && value.length > maxLength) {
+        errors.push(`${path} must be at most ${maxLength} chars`);
       }
     }
-  }
 
-  if (schemaType === "array" && schema.items && Array.isArray(value)) {
-    value.forEach((item, idx) => {
-      errors.push(...validateRecursive(item, schema.items as JsonSchema, `${path}[${idx}]`));
-    });
-  }
+    if (schemaType === "object") {
+      const obj = value as Record<string, unknown>;
+      for (const key of required) {
+        if (!(key in obj)) {
+          errors.push(`missing required ${childPath(path, key)}`);
+        }
+      }
+      if (properties.size > 0) {
+        for (const [key, propValue] of Object.entries(obj)) {
+          properties.get(key)?.(propValue, childPath(path, key), errors);
+        }
+      }
+    }
 
-  return errors;
+    if (items && Array.isArray(value)) {
+      value.forEach((item, idx) => {
+        items(item, `${path}[${idx}]`, errors);
+      });
+    }
+  };
 }
 
 export abstract class Tool {
@@ -90,7 +112,14 @@ export abstract class Tool {
     if (schema.type !== "object") {
       throw new Error(`Tool schema for ${this.name} must be object type`);
     }
-    return validateRecursive(params, schema, "parameter");
+    let validate = compiledSchemas.get(schema);
+    if (!validate) {
+      validate = compileSchema(schema);
+      compiledSchemas.set(schema, validate);
+    }
+    const errors: string[] = [];
+    validate(params, "parameter", errors);
+    return errors;
   }
 
   abstract execute(
@@ -10,15 +10,54 @@ function timestamp(): string {
   return new Date().toISOString();
 }
 
-function writeLine(level: LogLevel, scope: string, message: string): void {
-  const line = `[${timestamp()}] [${level}] [${scope}] ${message}\n`;
+const pendingFileLines = new Map<string, string[]>();
+let logDirReady = false;
+let flushScheduled = false;
+let exitHookInstalled = false;
+
+function flushFileLines(): void {
+  flushScheduled = false;
+  if (pendingFileLines.size === 0) {
+    return;
+  }
+  const batches = Array.from(pendingFileLines.entries());
+  pendingFileLines.clear();
   try {
-    mkdirSync(LOG_DIR, { recursive: true });
-    appendFileSync(path.join(LOG_DIR, `${scope}.log`), line, "utf8");
+    if (!logDirReady) {
+      mkdirSync(LOG_DIR, { recursive: true });
+      logDirReady = true;
+    }
+    for (const [scope, lines] of batches) {
+      appendFileSync(path.join(LOG_DIR, `${scope}.log`), lines.join(""), "utf8");
+    }
   } catch {
     // Best effort file logging.
+    logDirReady = false;
+  }
+}
+
+function queueFileLine(scope: string, line: string): void {
+  const lines = pendingFileLines.get(scope);
+  if (lines) {
+    lines.push(line);
+  } else {
+    pendingFileLines.set(scope, [line]);
   }
+  if (!exitHookInstalled) {
+    exitHookInstalled = true;
+    process.once("exit", flushFileLines);
+  }
+  if (!flushScheduled) {
+    flushScheduled = true;
+    setImmediate(flushFileLines).unref();
+  }
+}
+
+function writeLine(level: LogLevel, scope: string, message: string): void {
+  const line = `[${timestamp()}] [${level}] [${scope}] ${message}\n`;
+  queueFileLine(scope, line);
   if (level === "ERROR") {
+    flushFileLines();
     stderr.write(line);
     return;
   }
@@ -35,6 +74,10 @@ function formatMessage(message: string, fields: Record<string, unknown>): string
   return `${message} ${extras.join(" ")}`;
 }
 
+export function flushLogs(): void {
+  flushFileLines();
+}
+
 export interface Logger {
   info(message: string, fields?: Record<string, unknown>): void;
   warn(message: string, fields?: Record<string, unknown>): void;
@@ -88,25 +88,24 @@ function extractBalancedBraceCandidates(text: string): string[] {
   const out: string[] = [];
   let depth = 0;
   let start = -1;
-  let inString = false;
-  let escaped = false;
-
-  for (let i = 0; i < text.length; i += 1) {
-    const char = text[i];
-
-    if (inString) {
-      if (escaped) {
-        escaped = false;
-      } else if (char === "\\") {
-        escaped = true;
-      } else if (char === '"') {
-        inString = false;
-      }
-      continue;
-    }
+  const structural = /[{}"]/g;
+  const stringEnd = /["\\]/g;
+  let match: RegExpExecArray | null;
+
+  while ((match = structural.exec(text)) !== null) {
+    const i = match.index;
+    const char = match[0];
 
     if (char === '"') {
-      inString = true;
+      stringEnd.lastIndex = i + 1;
+      let closeMatch: RegExpExecArray | null;
+      while ((closeMatch = stringEnd.exec(text)) !== null && closeMatch[0] === "\\") {
+        stringEnd.lastIndex = closeMatch.index + 2;
+      }
+      if (!closeMatch) {
+        break;
+      }
+      structural.lastIndex = closeMatch.index + 1;
       continue;
     }
 
@@ -118,7 +117,7 @@ function extractBalancedBraceCandidates(text: string): string[] {
       continue;
     }
 
-    if (char === "}" && depth > 0) {
+    if (depth > 0) {
       depth -= 1;
       if (depth === 0 && start >= 0) {
         out.push(text.slice(start, i + 1));
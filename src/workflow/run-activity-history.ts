@@ -5,6 +5,7 @@ import type { SubagentTaskMessage, SubagentTaskToolCall } from "../bus/events.js
 
 const SAFE_RUN_ID = /^[A-Za-z0-9_-]+$/;
 const MAX_PERSISTED_ACTIVITIES = 800;
+const MAX_CACHED_RUNS = 32;
 
 function isObject(value: unknown): value is Record<string, unknown> {
   return typeof value === "object" && value !== null && !Array.isArray(value);
@@ -26,9 +27,19 @@ export interface WorkflowRunActivityRecord {
   toolCalls: SubagentTaskToolCall[];
 }
 
+interface RunActivityState {
+  activities: WorkflowRunActivityRecord[];
+  version: number;
+  persistedVersion: number;
+  flushing: Promise<void> | null;
+}
+
 export class WorkflowRunActivityHistoryRepository {
   private readonly workspace: string;
   private readonly dir: string;
+  private readonly states = new Map<string, RunActivityState>();
+  private readonly loadingStates = new Map<string, Promise<RunActivityState>>();
+  private readonly activeAppends = new Map<string, number>();
 
   constructor(workspace: string) {
     this.workspace = path.resolve(workspace);
@@ -37,11 +48,24 @@ export class WorkflowRunActivityHistoryRepository {
 
   async append(runId: string, activity: WorkflowRunActivityRecord): Promise<void> {
     const id = this.validateRunId(runId);
-    const current = await this.list(id);
-    const next = [activity, ...current.filter((item) => item.id !== activity.id)]
-      .sort((a, b) => b.timestamp.localeCompare(a.timestamp))
-      .slice(0, MAX_PERSISTED_ACTIVITIES);
-    await this.writeActivities(id, next);
+    this.activeAppends.set(id, (this.activeAppends.get(id) ?? 0) + 1);
+    try {
+      const state = await this.loadState(id);
+      const next = state.activities.filter((item) => item.id !== activity.id);
+      const insertAt = next.findIndex(
+        (item) => item.timestamp.localeCompare(activity.timestamp) <= 0,
+      );
+      next.splice(insertAt < 0 ? next.length : insertAt, 0, activity);
+      state.activities = next.slice(0, MAX_PERSISTED_ACTIVITIES);
+      await this.flush(id, state);
+    } finally {
+      const remaining = (this.activeAppends.get(id) ?? 1) - 1;
+      if (remaining > 0) {
+        this.activeAppends.set(id, remaining);
+      } else {
+        this.activeAppends.delete(id);
+      }
+    }
   }
 
   async list(runId: string, options?: { limit?: number }): Promise<WorkflowRunActivityRecord[]> {
@@ -71,6 +95,71 @@ export class WorkflowRunActivityHistoryRepository {
     return parsed.slice(0, limit);
   }
 
+  private async loadState(runId: string): Promise<RunActivityState> {
+    const cached = this.states.get(runId);
+    if (cached) {
+      this.states.delete(runId);
+      this.states.set(runId, cached);
+      return cached;
+    }
+    let pending = this.loadingStates.get(runId);
+    if (!pending) {
+      pending = this.list(runId)
+        .then((activities) => {
+          const state: RunActivityState = {
+            activities,
+            version: 0,
+            persistedVersion: 0,
+            flushing: null,
+          };
+          this.states.set(runId, state);
+          this.evictIdleStates(runId);
+          return state;
+        })
+        .finally(() => {
+          this.loadingStates.delete(runId);
+        });
+      this.loadingStates.set(runId, pending);
+    }
+    return pending;
+  }
+
+  private evictIdleStates(keepRunId: string): void {
+    for (const [runId, state] of this.states) {
+      if (this.states.size <= MAX_CACHED_RUNS) {
+        return;
+      }
+      const idle =
+        !this.activeAppends.has(runId) &&
+        !state.flushing &&
+        state.persistedVersion === state.version;
+      if (runId !== keepRunId && idle) {
+        this.states.delete(runId);
+      }
+    }
+  }
+
+  private async flush(runId: string, state: RunActivityState): Promise<void> {
+    state.version += 1;
+    const target = state.version;
+    while (state.persistedVersion < target) {
+      if (state.flushing) {
+        await state.flushing;
+        continue;
+      }
+      const version = state.version;
+      const writing = this.writeActivities(runId, state.activities)
+        .then(() => {
+          state.persistedVersion = Math.max(state.persistedVersion, version);
+        })
+        .finally(() => {
+          state.flushing = null;
+        });
+      state.flushing = writing;
+      await writing;
+    }
+  }
+
   private async writeActivities(runId: string, activities: WorkflowRunActivityRecord[]): Promise<void> {
     await mkdir(this.dir, { recursive: true });
     const filePath = this.resolvePath(runId);
@@ -89,6 +178,7 @@ export class WorkflowRunActivityHistoryRepository {
     if (!Array.isArray(parsed)) {
       return [];
     }
+    const fallbackAt = new Date().toISOString();
     const out: WorkflowRunActivityRecord[] = [];
     for (const item of parsed) {
       if (!isObject(item)) {
@@ -120,7 +210,7 @@ export class WorkflowRunActivityHistoryRepository {
           messages.push({
             role,
             content: typeof msg.content === "string" ? msg.content : "",
-            at: typeof msg.at === "string" ? msg.at : new Date().toISOString(),
+            at: typeof msg.at === "string" ? msg.at : fallbackAt,
             ...(typeof msg.name === "string" ? { name: msg.name } : {}),
             ...(typeof msg.toolCallId === "string" ? { toolCallId: msg.toolCallId } : {}),
           });
@@ -139,7 +229,7 @@ export class WorkflowRunActivityHistoryRepository {
               isObject(toolCall.arguments) ? (toolCall.arguments as Record<string, unknown>) : {},
             result: typeof toolCall.result === "string" ? toolCall.result : "",
             highRisk: toolCall.highRisk === true,
-            at: typeof toolCall.at === "string" ? toolCall.at : new Date().toISOString(),
+            at: typeof toolCall.at === "string" ? toolCall.at : fallbackAt,
           });
         }
       }
@@ -155,7 +245,7 @@ export class WorkflowRunActivityHistoryRepository {
         status,
         result: typeof item.result === "string" ? item.result : "",
         type,
-        timestamp: typeof item.timestamp === "string" ? item.timestamp : new Date().toISOString(),
+        timestamp: typeof item.timestamp === "string" ? item.timestamp : fallbackAt,
         messages,
         toolCalls,
       });
@@ -1,16 +1,37 @@
 import { randomUUID } from "node:crypto";
-import { mkdir, readdir, readFile, rename, writeFile } from "node:fs/promises";
+import type { Stats } from "node:fs";
+import { mkdir, readdir, readFile, rename, stat, writeFile } from "node:fs/promises";
 import path from "node:path";
 
 import type { WorkflowRunSnapshot } from "./engine.js";
 
 const SAFE_RUN_ID = /^[A-Za-z0-9_-]+$/;
+const MAX_CACHED_SNAPSHOTS = 512;
+const LIST_READ_CONCURRENCY = 16;
 
 interface StoredRunRecord {
   updatedAt: string;
   snapshot: WorkflowRunSnapshot;
 }
 
+interface RunFileStamp {
+  ino: number;
+  mtimeMs: number;
+  size: number;
+}
+
+interface CachedRunSnapshot extends RunFileStamp {
+  snapshot: WorkflowRunSnapshot;
+}
+
+interface ListedRun extends RunFileStamp {
+  startedAt: string;
+}
+
+function sameFile(stamp: RunFileStamp, info: Stats): boolean {
+  return stamp.ino === info.ino && stamp.mtimeMs === info.mtimeMs && stamp.size === info.size;
+}
+
 function isObject(value: unknown): value is Record<string, unknown> {
   return typeof value === "object" && value !== null && !Array.isArray(value);
 }
@@ -18,6 +39,8 @@ function isObject(value: unknown): value is Record<string, unknown> {
 export class WorkflowRunHistoryRepository {
   private readonly workspace: string;
   private readonly runsDir: string;
+  private readonly snapshotCache = new Map<string, CachedRunSnapshot>();
+  private readonly listing = new Map<string, ListedRun>();
 
   constructor(workspace: string) {
     this.workspace = path.resolve(workspace);
@@ -35,6 +58,7 @@ export class WorkflowRunHistoryRepository {
     };
     await writeFile(temp, `${JSON.stringify(payload, null, 2)}\n`, "utf8");
     await rename(temp, target);
+    this.snapshotCache.delete(runId);
     return target;
   }
 
@@ -45,10 +69,8 @@ export class WorkflowRunHistoryRepository {
     } catch {
       return null;
     }
-    const filePath = this.resolveRunPath(id);
-    let raw: string;
     try {
-      raw = await readFile(filePath, "utf8");
+      return await this.readSnapshot(id);
     } catch (error) {
       const message = error instanceof Error ? error.message : String(error);
       if (message.includes("ENOENT")) {
@@ -56,7 +78,6 @@ export class WorkflowRunHistoryRepository {
       }
       throw new Error(`Failed to read workflow run '${id}': ${message}`);
     }
-    return this.parseSnapshot(raw);
   }
 
   async list(options?: { limit?: number }): Promise<WorkflowRunSnapshot[]> {
@@ -72,33 +93,111 @@ export class WorkflowRunHistoryRepository {
       throw new Error(`Failed to list workflow runs: ${message}`);
     }
 
-    const rows: WorkflowRunSnapshot[] = [];
-    for (const name of names) {
-      if (!name.endsWith(".json")) {
-        continue;
+    const runIds = names
+      .filter((name) => name.endsWith(".json"))
+      .map((name) => name.slice(0, -5))
+      .filter((runId) => SAFE_RUN_ID.test(runId));
+
+    const listed = new Set(runIds);
+    for (const runId of this.listing.keys()) {
+      if (!listed.has(runId)) {
+        this.listing.delete(runId);
       }
-      const runId = name.slice(0, -5);
-      if (!SAFE_RUN_ID.test(runId)) {
-        continue;
+    }
+
+    const stats = await this.mapConcurrently(runIds, (runId) => this.indexRun(runId));
+    const entries: Array<{ runId: string; info: Stats; startedAt: string }> = [];
+    runIds.forEach((runId, index) => {
+      const info = stats[index];
+      const row = this.listing.get(runId);
+      if (info && row && sameFile(row, info)) {
+        entries.push({ runId, info, startedAt: row.startedAt });
       }
-      const filePath = this.resolveRunPath(runId);
+    });
+
+    entries.sort((a, b) => b.startedAt.localeCompare(a.startedAt));
+    const limit = options?.limit;
+    const selected = !limit || limit <= 0 ? entries : entries.slice(0, limit);
+    const snapshots = await this.mapConcurrently(selected, async ({ runId, info }) => {
       try {
-        const raw = await readFile(filePath, "utf8");
-        const snapshot = this.parseSnapshot(raw);
-        if (snapshot) {
-          rows.push(snapshot);
-        }
+        return await this.readSnapshot(runId, info);
       } catch {
         // Skip unreadable/corrupted entries.
+        return null;
+      }
+    });
+    return snapshots.filter((snapshot): snapshot is WorkflowRunSnapshot => snapshot !== null);
+  }
+
+  private async indexRun(runId: string): Promise<Stats | null> {
+    try {
+      const info = await stat(this.resolveRunPath(runId));
+      const row = this.listing.get(runId);
+      if (row && sameFile(row, info)) {
+        return info;
+      }
+      const snapshot = await this.readSnapshot(runId, info);
+      if (!snapshot) {
+        this.listing.delete(runId);
+        return null;
       }
+      this.listing.set(runId, {
+        ino: info.ino,
+        mtimeMs: info.mtimeMs,
+        size: info.size,
+        startedAt: snapshot.startedAt,
+      });
+      return info;
+    } catch {
+      // Skip unreadable/corrupted entries.
+      this.listing.delete(runId);
+      return null;
     }
+  }
 
-    rows.sort((a, b) => b.startedAt.localeCompare(a.startedAt));
-    const limit = options?.limit;
-    if (!limit || limit <= 0) {
-      return rows;
+  private async mapConcurrently<T, R>(items: T[], fn: (item: T) => Promise<R>): Promise<R[]> {
+    const results = new Array<R>(items.length);
+    let next = 0;
+    const worker = async (): Promise<void> => {
+      while (next < items.length) {
+        const index = next;
+        next += 1;
+        results[index] = await fn(items[index]);
+      }
+    };
+    await Promise.all(
+      Array.from({ length: Math.min(LIST_READ_CONCURRENCY, items.length) }, () => worker()),
+    );
+    return results;
+  }
+
+  private async readSnapshot(runId: string, known?: Stats): Promise<WorkflowRunSnapshot | null> {
+    const filePath = this.resolveRunPath(runId);
+    const info = known ?? (await stat(filePath));
+    const cached = this.snapshotCache.get(runId);
+    if (cached && sameFile(cached, info)) {
+      this.snapshotCache.delete(runId);
+      this.snapshotCache.set(runId, cached);
+      return cached.snapshot;
+    }
+
+    const snapshot = this.parseSnapshot(await readFile(filePath, "utf8"));
+    this.snapshotCache.delete(runId);
+    if (snapshot) {
+      this.snapshotCache.set(runId, {
+        ino: info.ino,
+        mtimeMs: info.mtimeMs,
+        size: info.size,
+        snapshot,
+      });
+      if (this.snapshotCache.size > MAX_CACHED_SNAPSHOTS) {
+        const oldest = this.snapshotCache.keys().next().value;
+        if (oldest !== undefined) {
+          this.snapshotCache.delete(oldest);
+        }
+      }
     }
-    return rows.slice(0, limit);
+    return snapshot;
   }
 
   private parseSnapshot(raw: string): WorkflowRunSnapshot | null {
@@ -8,13 +8,15 @@ import type { RuntimeRunActivity, RuntimeTraceEvent } from "../ui/runtime-state.
 const SAFE_ID = /^[A-Za-z0-9_-]+$/;
 const require = createRequire(import.meta.url);
 
+interface StatementLike {
+  run: (...args: unknown[]) => unknown;
+  get: (...args: unknown[]) => Record<string, unknown> | undefined;
+  all: (...args: unknown[]) => Array<Record<string, unknown>>;
+}
+
 interface DatabaseLike {
   exec(sql: string): void;
-  prepare(sql: string): {
-    run: (...args: unknown[]) => unknown;
-    get: (...args: unknown[]) => Record<string, unknown> | undefined;
-    all: (...args: unknown[]) => Array<Record<string, unknown>>;
-  };
+  prepare(sql: string): StatementLike;
   close(): void;
 }
 
@@ -63,6 +65,7 @@ export class RuntimeSqliteStore {
   private readonly dbPath: string;
   readonly available: boolean;
   private readonly db: DatabaseLike | null;
+  private readonly statements = new Map<string, StatementLike>();
 
   constructor(workspace: string) {
     this.workspace = path.resolve(workspace);
@@ -83,6 +86,7 @@ export class RuntimeSqliteStore {
   }
 
   close(): void {
+    this.statements.clear();
     this.db?.close();
   }
 
@@ -92,7 +96,7 @@ export class RuntimeSqliteStore {
     }
     const runId = this.validateId(run.runId, "run_id");
     const now = new Date().toISOString();
-    const stmt = this.db.prepare(`
+    const stmt = this.prepare(`
       INSERT INTO runtime_runs (run_id, workflow_id, status, started_at, ended_at, updated_at, payload_json)
       VALUES (?, ?, ?, ?, ?, ?, ?)
       ON CONFLICT(run_id) DO UPDATE SET
@@ -124,7 +128,7 @@ export class RuntimeSqliteStore {
     } catch {
       return null;
     }
-    const stmt = this.db.prepare(
+    const stmt = this.prepare(
       "SELECT payload_json FROM runtime_runs WHERE run_id = ? LIMIT 1",
     );
     const row = stmt.get(id) as Record<string, unknown> | undefined;
@@ -137,13 +141,13 @@ export class RuntimeSqliteStore {
     }
     const limit = options?.limit;
     if (limit && limit > 0) {
-      const stmt = this.db.prepare(
+      const stmt = this.prepare(
         "SELECT payload_json FROM runtime_runs ORDER BY started_at DESC LIMIT ?",
       );
       const rows = stmt.all(limit) as Array<Record<string, unknown>>;
       return parseJsonRows<WorkflowRunSnapshot>(rows);
     }
-    const stmt = this.db.prepare("SELECT payload_json FROM runtime_runs ORDER BY started_at DESC");
+    const stmt = this.prepare("SELECT payload_json FROM runtime_runs ORDER BY started_at DESC");
     const rows = stmt.all() as Array<Record<string, unknown>>;
     return parseJsonRows<WorkflowRunSnapshot>(rows);
   }
@@ -153,7 +157,7 @@ export class RuntimeSqliteStore {
       return;
     }
     const traceId = this.validateId(trace.id, "trace_id");
-    const stmt = this.db.prepare(`
+    const stmt = this.prepare(`
       INSERT INTO runtime_traces (trace_id, run_id, timestamp, payload_json)
       VALUES (?, ?, ?, ?)
       ON CONFLICT(trace_id) DO UPDATE SET
@@ -171,27 +175,27 @@ export class RuntimeSqliteStore {
     const runId = options?.runId?.trim();
     const limit = options?.limit;
     if (runId && limit && limit > 0) {
-      const stmt = this.db.prepare(
+      const stmt = this.prepare(
         "SELECT payload_json FROM runtime_traces WHERE run_id = ? ORDER BY timestamp DESC LIMIT ?",
       );
       const rows = stmt.all(runId, limit) as Array<Record<string, unknown>>;
       return parseJsonRows<RuntimeTraceEvent>(rows);
     }
     if (runId) {
-      const stmt = this.db.prepare(
+      const stmt = this.prepare(
         "SELECT payload_json FROM runtime_traces WHERE run_id = ? ORDER BY timestamp DESC",
       );
       const rows = stmt.all(runId) as Array<Record<string, unknown>>;
       return parseJsonRows<RuntimeTraceEvent>(rows);
     }
     if (limit && limit > 0) {
-      const stmt = this.db.prepare(
+      const stmt = this.prepare(
         "SELECT payload_json FROM runtime_traces ORDER BY timestamp DESC LIMIT ?",
       );
       const rows = stmt.all(limit) as Array<Record<string, unknown>>;
       return parseJsonRows<RuntimeTraceEvent>(rows);
     }
-    const stmt = this.db.prepare("SELECT payload_json FROM runtime_traces ORDER BY timestamp DESC");
+    const stmt = this.prepare("SELECT payload_json FROM runtime_traces ORDER BY timestamp DESC");
     const rows = stmt.all() as Array<Record<string, unknown>>;
     return parseJsonRows<RuntimeTraceEvent>(rows);
   }
@@ -201,7 +205,7 @@ export class RuntimeSqliteStore {
       return;
     }
     const activityId = this.validateId(activity.id, "activity_id");
-    const stmt = this.db.prepare(`
+    const stmt = this.prepare(`
       INSERT INTO runtime_activities (activity_id, run_id, timestamp, payload_json)
       VALUES (?, ?, ?, ?)
       ON CONFLICT(activity_id) DO UPDATE SET
@@ -224,13 +228,13 @@ export class RuntimeSqliteStore {
     }
     const limit = options.limit;
     if (limit && limit > 0) {
-      const stmt = this.db.prepare(
+      const stmt = this.prepare(
         "SELECT payload_json FROM runtime_activities WHERE run_id = ? ORDER BY timestamp DESC LIMIT ?",
       );
       const rows = stmt.all(runId, limit) as Array<Record<string, unknown>>;
       return parseJsonRows<RuntimeRunActivity>(rows);
     }
-    const stmt = this.db.prepare(
+    const stmt = this.prepare(
       "SELECT payload_json FROM runtime_activities WHERE run_id = ? ORDER BY timestamp DESC",
     );
     const rows = stmt.all(runId) as Array<Record<string, unknown>>;
@@ -243,7 +247,7 @@ export class RuntimeSqliteStore {
     }
     const approvalId = this.validateId(approval.approvalId, "approval_id");
     const now = new Date().toISOString();
-    const stmt = this.db.prepare(`
+    const stmt = this.prepare(`
       INSERT INTO runtime_approvals (approval_id, run_id, requested_at, status, updated_at, payload_json)
       VALUES (?, ?, ?, ?, ?, ?)
       ON CONFLICT(approval_id) DO UPDATE SET
@@ -271,13 +275,13 @@ export class RuntimeSqliteStore {
     const limit = options?.limit;
     const where = pendingOnly ? "WHERE status = 'pending'" : "";
     if (limit && limit > 0) {
-      const stmt = this.db.prepare(
+      const stmt = this.prepare(
         `SELECT payload_json FROM runtime_approvals ${where} ORDER BY requested_at DESC LIMIT ?`,
       );
       const rows = stmt.all(limit) as Array<Record<string, unknown>>;
       return parseJsonRows<WorkflowApprovalSnapshot>(rows);
     }
-    const stmt = this.db.prepare(
+    const stmt = this.prepare(
       `SELECT payload_json FROM runtime_approvals ${where} ORDER BY requested_at DESC`,
     );
     const rows = stmt.all() as Array<Record<string, unknown>>;
@@ -329,6 +333,18 @@ export class RuntimeSqliteStore {
     `);
   }
 
+  private prepare(sql: string): StatementLike {
+    if (!this.db) {
+      throw new Error("Runtime sqlite store is unavailable.");
+    }
+    let stmt = this.statements.get(sql);
+    if (!stmt) {
+      stmt = this.db.prepare(sql);
+      this.statements.set(sql, stmt);
+    }
+    return stmt;
+  }
+
   private validateId(input: string, label: string): string {
     const value = input.trim();
     if (!value) {
@@ -1,13 +1,15 @@
 import { mkdtemp, rm } from "node:fs/promises";
+import { createRequire } from "node:module";
 import os from "node:os";
 import path from "node:path";
 
-import { afterEach, describe, expect, it } from "vitest";
+import { afterEach, describe, expect, it, vi } from "vitest";
 
 import type { WorkflowApprovalSnapshot, WorkflowRunSnapshot } from "../src/workflow/engine.js";
 import type { RuntimeRunActivity, RuntimeTraceEvent } from "../src/ui/runtime-state.js";
 import { RuntimeSqliteStore } from "../src/workflow/runtime-sqlite.js";
 
+const require = createRequire(import.meta.url);
 const tempDirs: string[] = [];
 
 async function makeWorkspace(): Promise<string> {
@@ -17,6 +19,7 @@ async function makeWorkspace(): Promise<string> {
 }
 
 afterEach(async () => {
+  vi.restoreAllMocks();
   await Promise.all(
     tempDirs.splice(0).map((dir) =>
       rm(dir, {
@@ -117,4 +120,24 @@ describe("RuntimeSqliteStore", () => {
 
     store.close();
   });
+
+  it("prepares each statement once across repeated calls", async () => {
+    const workspace = await makeWorkspace();
+    const store = new RuntimeSqliteStore(workspace);
+    const { DatabaseSync } = require("node:sqlite") as {
+      DatabaseSync: { prototype: { prepare: (sql: string) => unknown } };
+    };
+    const prepare = vi.spyOn(DatabaseSync.prototype, "prepare");
+
+    store.upsertRun(makeRun("run_1"));
+    store.upsertRun({ ...makeRun("run_1"), status: "completed" });
+    store.upsertRun(makeRun("run_2"));
+    expect(prepare).toHaveBeenCalledTimes(1);
+
+    expect(store.getRun("run_1")?.status).toBe("completed");
+    expect(store.getRun("run_2")?.status).toBe("running");
+    expect(prepare).toHaveBeenCalledTimes(2);
+
+    store.close();
+  });
 });
@@ -0,0 +1,54 @@
+import { mkdir, mkdtemp, rm, writeFile } from "node:fs/promises";
+import os from "node:os";
+import path from "node:path";
+
+import { afterEach, describe, expect, it } from "vitest";
+
+import { SessionStore } from "../src/agent/session/session-store.js";
+
+const tempDirs: string[] = [];
+
+async function makeWorkspace(): Promise<string> {
+  const dir = await mkdtemp(path.join(os.tmpdir(), "session-store-test-"));
+  tempDirs.push(dir);
+  return dir;
+}
+
+afterEach(async () => {
+  await Promise.all(
+    tempDirs.splice(0).map((dir) =>
+      rm(dir, {
+        recursive: true,
+        force: true,
+      }),
+    ),
+  );
+});
+
+describe("SessionStore", () => {
+  it("loads hand-edited session files with a BOM and non-breaking spaces", async () => {
+    const workspace = await makeWorkspace();
+    const sessionsDir = path.join(workspace, "sessions");
+    await mkdir(sessionsDir, { recursive: true });
+    const metadata = JSON.stringify({
+      _type: "metadata",
+      key: "cli:direct",
+      created_at: "2026-03-05T10:00:00.000Z",
+      metadata: {},
+      last_consolidated: 1,
+    });
+    const raw = [
+      `\uFEFF${metadata}`,
+      "",
+      `${JSON.stringify({ role: "user", content: "hi" })}\u00a0`,
+      `  ${JSON.stringify({ role: "assistant", content: "hello" })}\r`,
+      "",
+    ].join("\n");
+    await writeFile(path.join(sessionsDir, "cli_direct.jsonl"), raw, "utf8");
+
+    const session = await new SessionStore(workspace).getOrCreate("cli:direct");
+
+    expect(session.lastConsolidated).toBe(1);
+    expect(session.messages.map((m) => m.content)).toEqual(["hi", "hello"]);
+  });
+});
@@ -0,0 +1,73 @@
+import { describe, expect, it } from "vitest";
+
+import type { JsonSchema } from "../src/tools/core/json-schema.js";
+import { Tool } from "../src/tools/core/tool.js";
+
+class SchemaTool extends Tool {
+  readonly name = "schema_tool";
+  readonly description = "validates against a fixed schema";
+  readonly parameters: JsonSchema;
+
+  constructor(parameters: JsonSchema) {
+    super();
+    this.parameters = parameters;
+  }
+
+  async execute(): Promise<string> {
+    return "ok";
+  }
+}
+
+const schema: JsonSchema = {
+  type: "object",
+  properties: {
+    mode: { type: "string", enum: ["fast", "slow"] },
+    count: { type: "integer", minimum: 1, maximum: 5 },
+    target: {
+      type: "object",
+      properties: {
+        name: { type: "string", minLength: 2 },
+      },
+      required: ["id", "name"],
+    },
+    tags: { type: "array", items: { type: "string", maxLength: 3 } },
+  },
+  required: ["mode", "count"],
+};
+
+describe("Tool.validateParams", () => {
+  it("reports nested, array and enum errors in a stable order", () => {
+    const tool = new SchemaTool(schema);
+    const params = { tags: ["ok", "long!", 3], target: { name: "x" }, mode: "medium" };
+
+    const expected = [
+      "missing required count",
+      "tags[1] must be at most 3 chars",
+      "tags[2] should be string",
+      "missing required target.id",
+      "target.name must be at least 2 chars",
+      'mode must be one of ["fast","slow"]',
+    ];
+    expect(tool.validateParams(params)).toEqual(expected);
+    // Second call goes through the cached validator.
+    expect(tool.validateParams(params)).toEqual(expected);
+  });
+
+  it("stops at a type mismatch before checking bounds", () => {
+    const tool = new SchemaTool(schema);
+
+    expect(tool.validateParams({ mode: "fast", count: 9.5 })).toEqual(["count should be integer"]);
+    expect(tool.validateParams({ mode: "fast", count: 9 })).toEqual(["count must be <= 5"]);
+    expect(tool.validateParams({ mode: "slow", count: 3, tags: ["a"] })).toEqual([]);
+  });
+
+  it("ignores null property schemas from external servers", () => {
+    const tool = new SchemaTool({
+      type: "object",
+      properties: { x: null, y: { type: "string" } },
+    } as unknown as JsonSchema);
+
+    expect(tool.validateParams({ x: 1, y: "ok" })).toEqual([]);
+    expect(tool.validateParams({ x: 1, y: 2 })).toEqual(["y should be string"]);
+  });
+});
@@ -78,4 +78,63 @@ describe("WorkflowRunActivityHistoryRepository", () => {
     expect(rows.map((row) => row.id)).toEqual(["a2", "a1"]);
     expect(rows[0]?.type).toBe("subagent.task.failed");
   });
+
+  it("persists every activity when appends overlap", async () => {
+    const workspace = await makeWorkspace();
+    const repo = new WorkflowRunActivityHistoryRepository(workspace);
+    await Promise.all(
+      [1, 2, 3, 4, 5].map((n) =>
+        repo.append(
+          "run_1",
+          makeActivity({
+            id: `a${n}`,
+            runId: "run_1",
+            timestamp: `2026-03-05T10:0${n}:00.000Z`,
+            type: "subagent.task.completed",
+          }),
+        ),
+      ),
+    );
+
+    const rows = await new WorkflowRunActivityHistoryRepository(workspace).list("run_1");
+    expect(rows.map((row) => row.id)).toEqual(["a5", "a4", "a3", "a2", "a1"]);
+  });
+
+  it("does not evict a run whose append is still in flight", async () => {
+    class InstantLoadRepository extends WorkflowRunActivityHistoryRepository {
+      instant = true;
+
+      override async list(
+        runId: string,
+        options?: { limit?: number },
+      ): Promise<WorkflowRunActivityRecord[]> {
+        return this.instant ? [] : super.list(runId, options);
+      }
+    }
+    const workspace = await makeWorkspace();
+    const repo = new InstantLoadRepository(workspace);
+    const activity = (id: string, runId: string, minute: number) =>
+      makeActivity({
+        id,
+        runId,
+        timestamp: `2026-03-05T10:0${minute}:00.000Z`,
+        type: "subagent.task.completed",
+      });
+
+    // Overflow the run cache while run_a's first append is still in flight.
+    const first = [
+      repo.append("run_a", activity("a1", "run_a", 1)),
+      ...Array.from({ length: 32 }, (_, index) =>
+        repo.append(`run_${index}`, activity(`x${index}`, `run_${index}`, 1)),
+      ),
+    ];
+    for (let tick = 0; tick < 10; tick += 1) {
+      await Promise.resolve();
+    }
+    repo.instant = false;
+    await Promise.all([...first, repo.append("run_a", activity("a2", "run_a", 2))]);
+
+    const rows = await new WorkflowRunActivityHistoryRepository(workspace).list("run_a");
+    expect(rows.map((row) => row.id)).toEqual(["a2", "a1"]);
+  });
 });
@@ -1,4 +1,4 @@
-import { mkdtemp, rm } from "node:fs/promises";
+import { mkdtemp, rm, stat, utimes } from "node:fs/promises";
 import os from "node:os";
 import path from "node:path";
 
@@ -80,4 +80,47 @@ describe("WorkflowRunHistoryRepository", () => {
     const rows = await repo.list();
     expect(rows.map((row) => row.runId)).toEqual(["run_2", "run_1"]);
   });
+
+  it("returns the newest runs when a limit is given", async () => {
+    const workspace = await makeWorkspace();
+    const repo = new WorkflowRunHistoryRepository(workspace);
+    await repo.save(snapshot("run_1", "2026-03-05T10:00:00.000Z"));
+    await repo.save(snapshot("run_3", "2026-03-05T10:20:00.000Z"));
+    await repo.save(snapshot("run_2", "2026-03-05T10:10:00.000Z"));
+
+    expect((await repo.list({ limit: 2 })).map((row) => row.runId)).toEqual(["run_3", "run_2"]);
+    await repo.save({ ...snapshot("run_1", "2026-03-05T10:30:00.000Z"), status: "completed" });
+    const rows = await repo.list({ limit: 2 });
+    expect(rows.map((row) => row.runId)).toEqual(["run_1", "run_3"]);
+    expect(rows[0]?.status).toBe("completed");
+  });
+
+  it("reloads a cached snapshot after another writer updates it", async () => {
+    const workspace = await makeWorkspace();
+    const reader = new WorkflowRunHistoryRepository(workspace);
+    const writer = new WorkflowRunHistoryRepository(workspace);
+    await writer.save(snapshot("run_1", "2026-03-05T10:00:00.000Z"));
+    expect((await reader.load("run_1"))?.status).toBe("running");
+
+    await writer.save({ ...snapshot("run_1", "2026-03-05T10:00:00.000Z"), status: "completed" });
+
+    expect((await reader.load("run_1"))?.status).toBe("completed");
+    expect((await reader.list()).map((row) => row.status)).toEqual(["completed"]);
+  });
+
+  it("reloads a same-size rewrite even when the mtime is unchanged", async () => {
+    const workspace = await makeWorkspace();
+    const repo = new WorkflowRunHistoryRepository(workspace);
+    const reader = new WorkflowRunHistoryRepository(workspace);
+    const base = snapshot("run_1", "2026-03-05T10:00:00.000Z");
+    const filePath = await repo.save({ ...base, status: "completed" });
+    expect((await reader.load("run_1"))?.status).toBe("completed");
+    const before = await stat(filePath);
+
+    await repo.save({ ...base, status: "cancelled" });
+    await utimes(filePath, before.atime, before.mtime);
+
+    expect((await stat(filePath)).size).toBe(before.size);
+    expect((await reader.load("run_1"))?.status).toBe("cancelled");
+  });
 });